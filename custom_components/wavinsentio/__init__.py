@@ -1,12 +1,15 @@
 """Wavin Sentio integration for Home Assistant."""
 
+import asyncio
 from datetime import timedelta
 import logging
+import time
 
 from homeassistant import config_entries, core
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from wavinsentio.wavinsentio import (
     Device,
@@ -17,7 +20,17 @@ from wavinsentio.wavinsentio import (
     WavinSentio,
 )
 
-from .const import CONF_DEVICE_NAME, DOMAIN
+from .capture import TrafficRecorder
+from .const import (
+    BACKGROUND_CONTEXT,
+    CONF_BACKGROUND_SCAN_INTERVAL,
+    CONF_CAPTURE_TRAFFIC,
+    CONF_DEVICE_NAME,
+    DEFAULT_BACKGROUND_SCAN_INTERVAL,
+    DEVICE_CONTEXT,
+    DISCOVERY_CACHE_TTL,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,48 +40,166 @@ async def async_setup_entry(hass: core.HomeAssistant, entry: config_entries.Conf
     """Set up Wavin Sentio from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
+    recorder = None
+    if entry.options.get(CONF_CAPTURE_TRAFFIC):
+        recorder = TrafficRecorder(
+            hass.config.path(f"{DOMAIN}_capture_{entry.entry_id}.jsonl")
+        )
+        entry.async_on_unload(recorder.close)
+        _LOGGER.warning("Capturing Wavin Sentio cloud traffic for %s", entry.title)
+
     try:
-        api = await hass.async_add_executor_job(
-            WavinSentio, entry.data[CONF_EMAIL], entry.data[CONF_PASSWORD]
+        session = await async_get_session(
+            hass, entry.data[CONF_EMAIL], entry.data[CONF_PASSWORD], recorder
         )
     except UnauthorizedException as err:
         raise ConfigEntryAuthFailed(err) from err
 
-    coordinator = WavinSentioDataCoordinator(hass, api, entry.data[CONF_DEVICE_NAME])
+    coordinator = WavinSentioDataCoordinator(
+        hass,
+        session.api,
+        entry.data[CONF_DEVICE_NAME],
+        recorder,
+        timedelta(
+            minutes=entry.options.get(
+                CONF_BACKGROUND_SCAN_INTERVAL, DEFAULT_BACKGROUND_SCAN_INTERVAL
+            )
+        ),
+    )
     hass.data[DOMAIN]["coordinator" + entry.data[CONF_DEVICE_NAME]] = coordinator
 
+    coordinator.options = dict(entry.options)
+
     await coordinator.async_config_entry_first_refresh()
+    coordinator.build_capabilities()
+
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+    coordinator.async_setup_done()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    # Updates to entry data, such as after a reauth, reload on their own.
+    coordinator = hass.data[DOMAIN]["coordinator" + entry.data[CONF_DEVICE_NAME]]
+    if entry.options != coordinator.options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> bool:
     """Unloading a config entry."""
-    unload_ok = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, platform)
-                for platform in PLATFORMS
-            ]
-        )
+    coordinator = hass.data[DOMAIN]["coordinator" + entry.data[CONF_DEVICE_NAME]]
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, coordinator.platforms
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].pop("coordinator" + entry.data[CONF_DEVICE_NAME], None)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> None:
+    """Release the account session when a config entry is removed.
+
+    The session is kept on unload so that reloads, including the one after a
+    reauth, do not log in again.
+    """
+    async_release_session(hass, entry.data[CONF_EMAIL], entry.entry_id)
+
+
 async def async_setup(hass: core.HomeAssistant, config: dict) -> bool:
     """Set up the Wavin Sentio component."""
     # @TODO: Add setup code.
     return True
 
 
-class WavinSentioDataCoordinator(DataUpdateCoordinator):
-    """Get and update the latest data."""
+class WavinSentioSession:
+    """An authenticated client shared by the config flow and all entries of an account."""
+
+    def __init__(self, api: WavinSentio) -> None:
+        """Initialize the session."""
+        self.api = api
+        self._devices: list[Device] | None = None
+        self._devices_time = 0.0
+
+    async def async_get_devices(self, hass: core.HomeAssistant) -> list[Device]:
+        """Return the devices of the account, reusing a recent discovery."""
+        if (
+            self._devices is None
+            or time.monotonic() - self._devices_time > DISCOVERY_CACHE_TTL.total_seconds()
+        ):
+            self._devices = await hass.async_add_executor_job(self.api.get_devices)
+            self._devices_time = time.monotonic()
+        return self._devices
+
+
+async def async_get_session(
+    hass: core.HomeAssistant,
+    email: str,
+    password: str,
+    recorder: TrafficRecorder | None = None,
+) -> WavinSentioSession:
+    """Return the session for an account, logging in only if there is none yet.
+
+    Raises UnauthorizedException if the login is rejected.
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    sessions = data.setdefault("sessions", {})
+    # Entries of one account are set up concurrently, so the first one logs
+    # in while the others wait for its session.
+    async with data.setdefault("session_lock", asyncio.Lock()):
+        session = sessions.get(email)
+        if session is not None and session.api.password == password:
+            return session
+
+        if recorder is None:
+            api = await hass.async_add_executor_job(WavinSentio, email, password)
+        else:
+            api = await hass.async_add_executor_job(
+                recorder.call, WavinSentio, email, password
+            )
+        session = sessions[email] = WavinSentioSession(api)
+        return session
+
+
+@callback
+def async_release_session(
+    hass: core.HomeAssistant, email: str, exclude_entry_id: str | None = None
+) -> None:
+    """Drop the session of an account unless a loaded entry still uses it."""
+    if any(
+        entry.data[CONF_EMAIL] == email
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != exclude_entry_id
+        and entry.state is config_entries.ConfigEntryState.LOADED
+    ):
+        return
+    hass.data.get(DOMAIN, {}).get("sessions", {}).pop(email, None)
 
-    def __init__(self, hass: core.HomeAssistant, api: WavinSentio, device_name) -> None:
+
+class WavinSentioDataCoordinator(DataUpdateCoordinator):
+    """Get and update the latest data.
+
+    Entities subscribe with a context that tells the coordinator what they
+    consume: climate entities use their room id, device wide entities use
+    DEVICE_CONTEXT and background consumers use BACKGROUND_CONTEXT. Only rooms
+    with a listener are indexed on refresh, and polling drops to the
+    background interval while nothing else listens. Listeners without a
+    context count as foreground consumers.
+    """
+
+    def __init__(
+        self,
+        hass: core.HomeAssistant,
+        api: WavinSentio,
+        device_name,
+        recorder: TrafficRecorder | None = None,
+        background_interval: timedelta = timedelta(
+            minutes=DEFAULT_BACKGROUND_SCAN_INTERVAL
+        ),
+    ) -> None:
         """Initialize the WavinSentioDataCoordinator."""
         super().__init__(
             hass,
@@ -76,17 +207,115 @@ class WavinSentioDataCoordinator(DataUpdateCoordinator):
             name="WavinSentioData",
             update_interval=timedelta(seconds=120),
         )
+        self.normal_interval = self.update_interval
+        self.background_interval = background_interval
         self.api = api
         self.device_name = device_name
+        self.recorder = recorder
+        self.options: dict = {}
+        self.platforms: list[str] = []
+        self.device_info: DeviceInfo | None = None
         self._device = None
+        self._rooms: dict[int, Room] = {}
+        self._setup_done = False
+
+    async def _async_call(self, func, *args):
+        """Run a blocking API call in the executor, capturing it when enabled."""
+        if self.recorder is None:
+            return await self.hass.async_add_executor_job(func, *args)
+        return await self.hass.async_add_executor_job(self.recorder.call, func, *args)
 
     async def _async_update_data(self):
         try:
-            self._device = await self.hass.async_add_executor_job(
+            self._device = await self._async_call(
                 self.api.get_device, self.device_name
             )
+        except UnauthorizedException as ex:
+            raise ConfigEntryAuthFailed(ex) from ex
         except KeyError as ex:
             raise UpdateFailed("Problems calling Wavin Sentio") from ex
+        self._index_rooms(set(self.async_contexts()))
+
+    def _index_rooms(self, room_ids) -> None:
+        """Index the rooms of the current snapshot that have a listener."""
+        self._rooms = {
+            room.id: room
+            for room in self._device.lastConfig.sentio.rooms
+            if room.id in room_ids
+        }
+
+    @callback
+    def async_add_listener(self, update_callback, context=None) -> CALLBACK_TYPE:
+        """Listen for data updates and adapt the polling to the listeners."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if (
+            self._device is not None
+            and context not in (None, BACKGROUND_CONTEXT, DEVICE_CONTEXT)
+            and context not in self._rooms
+        ):
+            self._index_rooms(set(self.async_contexts()))
+        self._async_update_interval()
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            self._async_update_interval()
+
+        return remove
+
+    @callback
+    def async_setup_done(self) -> None:
+        """Start adapting the polling once all platforms have subscribed.
+
+        The platforms subscribe concurrently during setup, so the interval is
+        left alone until then to avoid a refresh right after the first one.
+        """
+        self._setup_done = True
+        self._async_update_interval()
+
+    @callback
+    def _async_update_interval(self) -> None:
+        """Poll at the background interval when only background consumers listen."""
+        # async_contexts() leaves out listeners without a context.
+        contexts = {context for _, context in self._listeners.values()}
+        if not self._setup_done or not contexts:
+            return
+        if contexts <= {BACKGROUND_CONTEXT}:
+            self.update_interval = self.background_interval
+        elif self.update_interval != self.normal_interval:
+            self.update_interval = self.normal_interval
+            # Refresh now, which also reschedules at the normal interval.
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.async_request_refresh(),
+                f"{DOMAIN} refresh {self.device_name}",
+            )
+
+    def build_capabilities(self) -> None:
+        """Work out the platforms and shared device info from the first snapshot.
+
+        Only platforms that have entities to create are forwarded, so adding
+        outdoor sensors to the controller requires a reload of the entry.
+        """
+        device = self.get_device()
+        sentio = device.lastConfig.sentio
+        unused = set()
+        if not sentio.rooms:
+            unused.add("climate")
+        if not sentio.outdoorTemperatureSensors:
+            unused.add("sensor")
+        self.platforms = [platform for platform in PLATFORMS if platform not in unused]
+        self.device_info = DeviceInfo(
+            identifiers={
+                # Serial numbers are unique identifiers within a specific domain
+                (DOMAIN, device.name)
+            },
+            name=sentio.titlePersonalized,
+            manufacturer="Wavin",
+            model="Sentio",
+            serial_number=device.serialNumber,
+            sw_version=device.firmwareInstalled,
+        )
 
     def get_device(self) -> Device:
         """Return the current device."""
@@ -97,50 +326,47 @@ class WavinSentioDataCoordinator(DataUpdateCoordinator):
         return self.get_device().lastConfig.sentio.rooms
 
     def get_room(self, id) -> Room:
-        """Return the room with the specified id, or None if not found."""
-        for room in self.get_device().lastConfig.sentio.rooms:
-            if room.id == id:
-                return room
-        return None
+        """Return the room with the specified id, or None if it is unknown or has no listener."""
+        return self._rooms.get(id)
 
-    def set_new_temperature(self, room_id, temperature):
+    async def set_new_temperature(self, room_id, temperature):
         """Set a new temperature for the specified room."""
         _LOGGER.debug("Setting temperature: %s", temperature)
-        return self.hass.async_add_executor_job(
+        await self._async_call(
             self.api.set_temperature, self.device_name, room_id, temperature
         )
 
-    def set_new_profile(self, code, profile):
+    async def set_new_profile(self, code, profile):
         """Set a new profile for the specified code."""
         _LOGGER.debug("Setting profile: %s", profile)
-        self.hass.async_add_executor_job(self.api.set_profile, code, profile)
+        await self._async_call(self.api.set_profile, code, profile)
 
-    def turn_on_standby(self):
+    async def turn_on_standby(self):
         """Turn on standby mode for the device."""
-        self.hass.async_add_executor_job(self.api.set_standby_mode, self.device_name, StandbyMode.STANDBY_MODE_ON)
+        await self._async_call(self.api.set_standby_mode, self.device_name, StandbyMode.STANDBY_MODE_ON)
 
-    def turn_off_standby(self):
+    async def turn_off_standby(self):
         """Turn off standby mode for the device."""
-        self.hass.async_add_executor_job(self.api.set_standby_mode, self.device_name, StandbyMode.STANDBY_MODE_OFF)
+        await self._async_call(self.api.set_standby_mode, self.device_name, StandbyMode.STANDBY_MODE_OFF)
 
-    def turn_on_vacation_mode_device(self):
+    async def turn_on_vacation_mode_device(self):
         """Turn on vacation mode for the device."""
-        self.hass.async_add_executor_job(self.api.set_vacation_mode, self.device_name, VacationMode.VACATION_MODE_ON)
+        await self._async_call(self.api.set_vacation_mode, self.device_name, VacationMode.VACATION_MODE_ON)
 
-    def turn_off_vacation_mode_device(self):
+    async def turn_off_vacation_mode_device(self):
         """Turn off vaction mode for the device."""
-        self.hass.async_add_executor_job(self.api.set_vacation_mode, self.device_name, VacationMode.VACATION_MODE_OFF)
+        await self._async_call(self.api.set_vacation_mode, self.device_name, VacationMode.VACATION_MODE_OFF)
 
-    def turn_on_vacation_mode_room(self, room_id: int):
+    async def turn_on_vacation_mode_room(self, room_id: int):
         """Turn on vacation mode for the room."""
-        self.hass.async_add_executor_job(self.api.set_vacation_mode_room, self.device_name, room_id, VacationMode.VACATION_MODE_ON)
+        await self._async_call(self.api.set_vacation_mode_room, self.device_name, room_id, VacationMode.VACATION_MODE_ON)
 
-    def turn_off_vacation_mode_room(self, room_id: int):
+    async def turn_off_vacation_mode_room(self, room_id: int):
         """Turn off vacation mode for the room."""
-        self.hass.async_add_executor_job(self.api.set_vacation_mode_room, self.device_name, room_id, VacationMode.VACATION_MODE_OFF)
+        await self._async_call(self.api.set_vacation_mode_room, self.device_name, room_id, VacationMode.VACATION_MODE_OFF)
 
-    def set_vacation_mode_until(self, value):
+    async def set_vacation_mode_until(self, value):
         """Set the vacation mode until value."""
         _LOGGER.debug("Setting vacation mode until: %s", value)
-        return self.hass.async_add_executor_job(self.api.set_vacation_mode_until, self.device_name, value)
+        await self._async_call(self.api.set_vacation_mode_until, self.device_name, value)
 
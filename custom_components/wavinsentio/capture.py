@@ -0,0 +1,233 @@
+"""Record and replay Wavin Sentio cloud traffic.
+
+The recorder captures the HTTP exchanges the WavinSentio client makes while
+one of its methods runs, including logins made to refresh the token, and
+appends one compact JSON line per exchange, with timing, to a rotating
+capture file. Bodies are written as the cloud sent them, except that
+credentials and secrets are redacted.
+
+The replay client serves such a capture back through the same methods as
+WavinSentio, parsing the recorded bodies with the library's own classes, so
+it can be handed to WavinSentioDataCoordinator in place of the real client.
+"""
+
+from collections import defaultdict, deque
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+import threading
+import time
+from urllib.parse import urlsplit
+
+from wavinsentio import wavinsentio
+from wavinsentio.wavinsentio import Device
+
+CAPTURE_MAX_BYTES = 5 * 1024 * 1024
+CAPTURE_BACKUP_COUNT = 3
+
+REDACTED = "**REDACTED**"
+REDACTED_KEYS = {"email", "password", "idToken", "refreshToken", "registrationKey"}
+
+_active = threading.local()
+_install_lock = threading.Lock()
+_open_recorders = 0
+
+
+def _redact(value):
+    """Return a copy of a JSON value with secrets replaced."""
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in REDACTED_KEYS else _redact(item)
+            for key, item in value.items()
+        }
+    return value
+
+
+class _RecordingRequests:
+    """Stand-in for the requests module as used by the WavinSentio library.
+
+    Posts made from a thread inside TrafficRecorder.call are recorded, all
+    other posts and attributes go straight to requests.
+    """
+
+    def __init__(self, requests_module) -> None:
+        self._requests = requests_module
+
+    def __getattr__(self, name):
+        return getattr(self._requests, name)
+
+    def post(self, url, **kwargs):
+        recorder = getattr(_active, "recorder", None)
+        if recorder is None:
+            return self._requests.post(url, **kwargs)
+        return recorder.record_post(self._requests.post, url, **kwargs)
+
+
+class TrafficRecorder:
+    """Write the cloud traffic of the calls made through it to a capture file."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = CAPTURE_MAX_BYTES,
+        backup_count: int = CAPTURE_BACKUP_COUNT,
+    ) -> None:
+        """Initialize the recorder. The file is not opened until first write."""
+        self._handler = RotatingFileHandler(
+            path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        self._closed = False
+        # The library calls requests.post on its module global, so replacing
+        # that global is the only hook; this breaks if it moves to a session.
+        global _open_recorders
+        with _install_lock:
+            if _open_recorders == 0:
+                wavinsentio.requests = _RecordingRequests(wavinsentio.requests)
+            _open_recorders += 1
+
+    def call(self, func, *args):
+        """Call func with args and record the HTTP exchanges it makes.
+
+        This blocks and must run in the executor. If func raises, the error
+        is recorded as well.
+        """
+        _active.recorder = self
+        _active.method = func.__name__
+        start = time.monotonic()
+        try:
+            return func(*args)
+        except Exception as err:
+            self._write(
+                {
+                    "method": func.__name__,
+                    "duration": round(time.monotonic() - start, 4),
+                    "error": repr(err),
+                }
+            )
+            raise
+        finally:
+            _active.recorder = None
+
+    def record_post(self, post, url, **kwargs):
+        """Send a post through requests and record the exchange."""
+        record = {
+            "method": _active.method,
+            # The path names the endpoint, the query holds the API key.
+            "endpoint": urlsplit(url).path.rsplit("/", 1)[-1],
+            "request": _redact(kwargs.get("json", kwargs.get("data"))),
+        }
+        start = time.monotonic()
+        try:
+            response = post(url, **kwargs)
+        except Exception as err:
+            record["duration"] = round(time.monotonic() - start, 4)
+            record["error"] = repr(err)
+            self._write(record)
+            raise
+        record["duration"] = round(time.monotonic() - start, 4)
+        record["status"] = response.status_code
+        try:
+            record["response"] = _redact(response.json())
+        except ValueError:
+            record["response"] = response.text
+        self._write(record)
+        return response
+
+    def close(self) -> None:
+        """Flush and close the capture file.
+
+        The last recorder to close puts the requests module back.
+        """
+        global _open_recorders
+        self._handler.close()
+        with _install_lock:
+            if self._closed:
+                return
+            self._closed = True
+            _open_recorders -= 1
+            if _open_recorders == 0:
+                wavinsentio.requests = wavinsentio.requests._requests
+
+    def _write(self, record) -> None:
+        record = {"ts": round(time.time(), 3), **record}
+        self._handler.handle(
+            logging.makeLogRecord({"msg": json.dumps(record, separators=(",", ":"))})
+        )
+
+
+class ReplayError(Exception):
+    """A call that failed when the capture was recorded."""
+
+
+class WavinSentioReplay:
+    """Serve a capture file through the WavinSentio client interface."""
+
+    def __init__(self, path: str, speed: float = 1.0) -> None:
+        """Load the capture.
+
+        A speed of 1 replays at the recorded latency, higher values replay
+        faster and 0 disables the delays altogether.
+        """
+        self.speed = speed
+        self._exchanges: dict[str, deque] = defaultdict(deque)
+        with open(path, encoding="utf-8") as capture:
+            for line in capture:
+                if line.strip():
+                    record = json.loads(line)
+                    if "endpoint" in record:
+                        self._exchanges[record["endpoint"]].append(record)
+
+    def _next(self, endpoint):
+        """Return the next recorded response body for endpoint, rewinding at the end."""
+        exchanges = self._exchanges.get(endpoint)
+        if not exchanges:
+            raise ReplayError(f"No recorded exchanges for {endpoint}")
+        record = exchanges[0]
+        exchanges.rotate(-1)
+        if self.speed:
+            time.sleep(record["duration"] / self.speed)
+        if "error" in record:
+            raise ReplayError(record["error"])
+        return record.get("response")
+
+    def get_devices(self) -> list[Device]:
+        """Return the recorded device list, filtered like the library does."""
+        return [
+            Device(data)
+            for data in self._next("ListDevices")["devices"]
+            if "platform" not in data
+        ]
+
+    def get_device(self, device_name) -> Device:
+        """Return the next recorded device snapshot."""
+        return Device(self._next("GetDevice"))
+
+    def set_temperature(self, device_name, room_id, temperature):
+        """Replay a temperature command."""
+        self._next("SendDeviceConfig")
+
+    def set_profile(self, code, profile):
+        """Replay a profile command, which the library does not implement."""
+        raise ReplayError("Not implemented yet")
+
+    def set_standby_mode(self, device_name, standby_mode):
+        """Replay a standby mode command."""
+        self._next("SendDeviceConfig")
+
+    def set_vacation_mode(self, device_name, vacation_mode):
+        """Replay a vacation mode command."""
+        self._next("SendDeviceConfig")
+
+    def set_vacation_mode_room(self, device_name, room_id, vacation_mode):
+        """Replay a room vacation mode command."""
+        self._next("SendDeviceConfig")
+
+    def set_vacation_mode_until(self, device_name, vacation_mode_until):
+        """Replay a vacation mode until command."""
+        self._next("SendDeviceConfig")
@@ -10,6 +10,7 @@ from homeassistant.components.climate import (
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from wavinsentio.wavinsentio import HCMode, Room, StandbyMode, VacationMode
 
@@ -32,48 +33,44 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
     """Set up Wavin Sentio climate entities from a config entry."""
     dataservice = cast(WavinSentioDataCoordinator,hass.data[DOMAIN].get("coordinator" + entry.data[CONF_DEVICE_NAME]))
 
-    rooms = dataservice.get_device().lastConfig.sentio.rooms
+    sentio = dataservice.get_device().lastConfig.sentio
+    hvac_modes = [HVAC_MODES[mode] for mode in sentio.availableHcModes if mode in HVAC_MODES]
 
     entities = []
-    for room in rooms:
-        ws = WavinSentioClimateEntity(hass, room, dataservice)
+    for room in sentio.rooms:
+        ws = WavinSentioClimateEntity(hass, room, dataservice, hvac_modes)
         entities.append(ws)
     async_add_entities(entities)
 
 class WavinSentioClimateEntity(CoordinatorEntity, ClimateEntity):
     """Representation of a Wavin Sentio Climate device."""
 
-    def __init__(self, hass: HomeAssistant, room: Room, dataservice: WavinSentioDataCoordinator) -> None:
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
+    )
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_preset_modes = list(PRESET_MODES)
+
+    def __init__(self, hass: HomeAssistant, room: Room, dataservice: WavinSentioDataCoordinator, hvac_modes: list[HVACMode]) -> None:
         """Initialize the climate device."""
-        super().__init__(dataservice)
-        self._name = room.titlePersonalized
+        super().__init__(dataservice, context=room.id)
         self._room_id = room.id
-        availableHcModes = dataservice.get_device().lastConfig.sentio.availableHcModes
-        _hvac_modes = []
-        for mode in availableHcModes:
-            if mode == HCMode.HC_MODE_HEATING.value:
-                _hvac_modes.append(HVACMode.HEAT)
-            elif mode == HCMode.HC_MODE_COOLING.value:
-                _hvac_modes.append(HVACMode.COOL)
-        self._hvac_modes = _hvac_modes
-        self._attr_supported_features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
+        self._attr_name = room.titlePersonalized
+        self._attr_unique_id = room.id
+        self._attr_hvac_modes = hvac_modes
+        self._attr_device_info = DeviceInfo(
+            identifiers={
+                # Serial numbers are unique identifiers within a specific domain
+                (DOMAIN, room.id)
+            },
+            name=room.titlePersonalized,
+            manufacturer="Wavin",
+            model="Sentio",
         )
         self._preset_mode = None
-        self._unit_of_measurement = UnitOfTemperature.CELSIUS
         self._on = True
         self._dataservice = dataservice
 
-    @property
-    def name(self):
-        """Return the name of the climate device."""
-        return self._name
-
-    @property
-    def temperature_unit(self):
-        """Return the unit of measurement."""
-        return self._unit_of_measurement
-
     @property
     def current_temperature(self):
         """Return the current temperature."""
@@ -118,6 +115,8 @@ class WavinSentioClimateEntity(CoordinatorEntity, ClimateEntity):
     def preset_mode(self):
         """Return the current preset mode."""
         temp_room = self._dataservice.get_room(self._room_id)
+        if temp_room is None:
+            return None
         if temp_room.vacationMode == VacationMode.VACATION_MODE_ON:
             return "Vacation"
         for preset in temp_room.temperaturePresets :
@@ -127,11 +126,6 @@ class WavinSentioClimateEntity(CoordinatorEntity, ClimateEntity):
                         return mode
         return None
 
-    @property
-    def preset_modes(self):
-        """Return available preset modes."""
-        return list(PRESET_MODES)
-
     async def async_set_preset_mode(self, preset_mode):
         """Set new target preset mode."""
         if preset_mode not in PRESET_MODES:
@@ -141,20 +135,22 @@ class WavinSentioClimateEntity(CoordinatorEntity, ClimateEntity):
         if preset_mode == "Vacation" and self._dataservice.get_device().lastConfig.sentio.vacationSettings.vacationMode != VacationMode.VACATION_MODE_ON:
             raise ValueError("Device is not in vacation mode, cannot set preset.")
         if preset_mode == "Vacation":
-            self._dataservice.turn_on_vacation_mode_room(
+            await self._dataservice.turn_on_vacation_mode_room(
                 self._room_id
             )
         else:
             if self._dataservice.get_device().lastConfig.sentio.vacationSettings.vacationMode == VacationMode.VACATION_MODE_ON:
-                self._dataservice.turn_off_vacation_mode_room(
+                await self._dataservice.turn_off_vacation_mode_room(
                     self._room_id
                 )
             temp_room = self._dataservice.get_room(self._room_id)
+            if temp_room is None:
+                raise ValueError(f"Room {self._room_id} is not available.")
             for mode, details in PRESET_MODES.items():
                 if mode == preset_mode:
                     for preset in temp_room.temperaturePresets:
                         if preset.type == details.get("type") and preset.hcMode == self._dataservice.get_device().lastConfig.sentio.hcMode.value:
-                            self._dataservice.set_new_temperature(
+                            await self._dataservice.set_new_temperature(
                                 self._room_id, preset.setpointTemperature
                             )
                             break
@@ -187,6 +183,8 @@ class WavinSentioClimateEntity(CoordinatorEntity, ClimateEntity):
     def hvac_action(self):
         """Return the current running hvac operation if supported."""
         temp_room = self._dataservice.get_room(self._room_id)
+        if temp_room is None:
+            return None
         if temp_room.temperatureState == "TEMPERATURE_STATE_HEATING":
             return HVACAction.HEATING
         if temp_room.temperatureState == "TEMPERATURE_STATE_COOLING":
@@ -202,36 +200,10 @@ class WavinSentioClimateEntity(CoordinatorEntity, ClimateEntity):
             return HVACMode.COOL
         raise ValueError("Unknown HVAC mode")
 
-    @property
-    def hvac_modes(self):
-        """Return the list of available operation modes."""
-        return self._hvac_modes
-
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new target hvac mode."""
         raise ValueError("You cannot set the HVAC mode directly.")
 
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return self._room_id
-
-    @property
-    def device_info(self):
-        """Return device information for this climate entity."""
-        temp_room = self._dataservice.get_room(self._room_id)
-        if temp_room is not None:
-            return {
-                "identifiers": {
-                    # Serial numbers are unique identifiers within a specific domain
-                    (DOMAIN, self.unique_id)
-                },
-                "name": self._name,
-                "manufacturer": "Wavin",
-                "model": "Sentio",
-            }
-        return {}
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
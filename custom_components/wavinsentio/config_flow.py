@@ -6,10 +6,18 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
-from wavinsentio.wavinsentio import UnauthorizedException, WavinSentio
-
-from .const import CONF_DEVICE_NAME, DOMAIN
+from wavinsentio.wavinsentio import UnauthorizedException
+
+from . import async_get_session, async_release_session
+from .const import (
+    CONF_BACKGROUND_SCAN_INTERVAL,
+    CONF_CAPTURE_TRAFFIC,
+    CONF_DEVICE_NAME,
+    DEFAULT_BACKGROUND_SCAN_INTERVAL,
+    DOMAIN,
+)
 
 AUTH_SCHEMA = vol.Schema(
     {vol.Required(CONF_EMAIL): cv.string, vol.Required(CONF_PASSWORD): cv.string}
@@ -26,6 +34,12 @@ class WavinSentioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._password = None
         self._devices = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow for this handler."""
+        return WavinSentioOptionsFlow()
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Invoke when a user initiates a flow via the user interface."""
         errors: dict[str, str] = {}
@@ -52,18 +66,23 @@ class WavinSentioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         errors = {}
         try:
-            api = await self.hass.async_add_executor_job(
-                WavinSentio, self._email, self._password
-            )
+            session = await async_get_session(self.hass, self._email, self._password)
         except UnauthorizedException:
             errors["base"] = "auth_error"
             return self.async_show_form(
                 step_id="user", data_schema=AUTH_SCHEMA, errors=errors
             )
 
-        self._devices  = await self.hass.async_add_executor_job(api.get_devices)
+        self._devices = await session.async_get_devices(self.hass)
 
-        all_devices = {d.name:d.lastConfig.sentio.titlePersonalized for d in self._devices}
+        # Controllers of the account that are already set up are not offered
+        # again, except when re-authenticating one of them.
+        configured = set()
+        if self.source != config_entries.SOURCE_REAUTH:
+            configured = self._async_current_ids()
+        all_devices = {d.name:d.lastConfig.sentio.titlePersonalized for d in self._devices if d.name not in configured}
+        if not all_devices:
+            return self.async_abort(reason="already_configured")
 
         DEVICE_SCHEMA = vol.Schema(
             {vol.Optional(CONF_DEVICE_NAME): vol.In(all_devices)}
@@ -73,8 +92,19 @@ class WavinSentioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="device", data_schema=DEVICE_SCHEMA, errors=errors
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Drop the cached session if the flow ends without a loaded entry using it."""
+        if self._email is not None:
+            async_release_session(self.hass, self._email)
+
     async def async_step_reauth(self, user_input=None):
         """Handle re-authentication step in the config flow."""
+        if user_input is not None:
+            # The cached session holds the rejected credentials.
+            self.hass.data.get(DOMAIN, {}).get("sessions", {}).pop(
+                user_input[CONF_EMAIL], None
+            )
         return await self.async_step_user()
 
     async def async_create_entry(self, title: str, data: dict) -> dict:
@@ -85,3 +115,29 @@ class WavinSentioConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.hass.config_entries.async_reload(existing_entry.entry_id)
             return self.async_abort(reason="reauth_successful")
         return super().async_create_entry(title=title, data=data)
+
+
+class WavinSentioOptionsFlow(config_entries.OptionsFlow):
+    """Wavin Sentio options flow."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_CAPTURE_TRAFFIC,
+                    default=self.config_entry.options.get(CONF_CAPTURE_TRAFFIC, False),
+                ): bool,
+                vol.Optional(
+                    CONF_BACKGROUND_SCAN_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_BACKGROUND_SCAN_INTERVAL, DEFAULT_BACKGROUND_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=2, max=1440)),
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=options_schema)
@@ -1,6 +1,19 @@
 """Constants for the Wavin Sentio integration."""
 
+from datetime import timedelta
+
 DOMAIN = "wavinsentio"
 
 CONF_DEVICE_NAME = "Device"
 
+CONF_CAPTURE_TRAFFIC = "capture_traffic"
+
+CONF_BACKGROUND_SCAN_INTERVAL = "background_scan_interval"
+
+DEFAULT_BACKGROUND_SCAN_INTERVAL = 15
+
+BACKGROUND_CONTEXT = "background"
+
+DEVICE_CONTEXT = "device"
+
+DISCOVERY_CACHE_TTL = timedelta(minutes=10)
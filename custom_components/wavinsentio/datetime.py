@@ -6,11 +6,10 @@ setting for Wavin Sentio devices in Home Assistant.
 
 from homeassistant.components.datetime import DateTimeEntity
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import WavinSentioDataCoordinator
-from .const import CONF_DEVICE_NAME, DOMAIN
+from .const import CONF_DEVICE_NAME, DEVICE_CONTEXT, DOMAIN
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entities):
@@ -41,10 +40,11 @@ class WavinSentioVacationUntilEntity(CoordinatorEntity, DateTimeEntity):
 
     def __init__(self, dataservice: WavinSentioDataCoordinator) -> None:
         """Initialize the Wavin Sentio Vacation Until entity."""
-        super().__init__(dataservice)
+        super().__init__(dataservice, context=DEVICE_CONTEXT)
         self._dataservice = dataservice
         self._attr_name = "Vacation Mode Until"
         self._attr_unique_id = f"{dataservice.get_device().name}_vacation_mode_until"
+        self._attr_device_info = dataservice.device_info
 
     @property
     def native_value(self):
@@ -61,17 +61,3 @@ class WavinSentioVacationUntilEntity(CoordinatorEntity, DateTimeEntity):
         await self._dataservice.set_vacation_mode_until(value)
         self._attr_native_value = value
         self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        return DeviceInfo(
-            identifiers= {
-                (DOMAIN, self._dataservice.get_device().name)
-            },
-            name = self._dataservice.get_device().lastConfig.sentio.titlePersonalized,
-            manufacturer = "Wavin",
-            model = "Sentio",
-            serial_number = self._dataservice.get_device().serialNumber,
-            sw_version = self._dataservice.get_device().firmwareInstalled,
-        )
@@ -3,11 +3,12 @@
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from wavinsentio.wavinsentio import OutdoorTemperatureSensor
 
 from . import WavinSentioDataCoordinator
-from .const import CONF_DEVICE_NAME, DOMAIN
+from .const import BACKGROUND_CONTEXT, CONF_DEVICE_NAME, DOMAIN
 
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
@@ -36,15 +37,21 @@ class WavinSentioOutdoorTemperatureSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(self, dataservice : WavinSentioDataCoordinator, outdoorTemperatureSensor: OutdoorTemperatureSensor) -> None:
         """Initialize the sensor."""
-        super().__init__(dataservice)
+        super().__init__(dataservice, context=BACKGROUND_CONTEXT)
         self._state = None
         self._dataservice = dataservice
         self._outdoorTemperatureSensor = outdoorTemperatureSensor
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Outdoor Temperature"
+        self._attr_name = "Outdoor Temperature"
+        self._attr_unique_id = f"OutdoorTemperature-{outdoorTemperatureSensor.id}"
+        self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        self._attr_device_info = DeviceInfo(
+            identifiers={
+                (DOMAIN, self._attr_unique_id)
+            },
+            name=self._attr_name,
+            manufacturer="Wavin",
+            model="Sentio",
+        )
 
     @property
     def state(self):
@@ -58,25 +65,3 @@ class WavinSentioOutdoorTemperatureSensor(CoordinatorEntity, SensorEntity):
     def unit_of_measurement(self) -> str:
         """Return the unit of measurement."""
         return UnitOfTemperature.CELSIUS
-
-    @property
-    def device_class(self):
-        """Return the device class for the sensor."""
-        return SensorDeviceClass.TEMPERATURE
-
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return f"OutdoorTemperature-{self._outdoorTemperatureSensor.id}"
-
-    @property
-    def device_info(self):
-        """Return device information for Home Assistant device registry."""
-        return {
-            "identifiers": {
-                (DOMAIN, self.unique_id)
-            },
-            "name": self.name,
-            "manufacturer": "Wavin",
-            "model": "Sentio",
-        }
@@ -2,12 +2,11 @@
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from wavinsentio.wavinsentio import StandbyMode, VacationMode
 
 from . import WavinSentioDataCoordinator
-from .const import CONF_DEVICE_NAME, DOMAIN
+from .const import CONF_DEVICE_NAME, DEVICE_CONTEXT, DOMAIN
 
 
 async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
@@ -24,16 +23,13 @@ class WavinSentioStandbySwitchEntity(CoordinatorEntity, SwitchEntity):
 
     def __init__(self, dataservice: WavinSentioDataCoordinator) -> None:
         """Initialize the Wavin Sentio Standby Switch entity."""
-        super().__init__(dataservice)
+        super().__init__(dataservice, context=DEVICE_CONTEXT)
         self._dataservice = dataservice
-        self._name = "Standby"
+        self._attr_name = "Standby"
+        self._attr_unique_id = str(dataservice.get_device().name) + "-Standby"
+        self._attr_device_info = dataservice.device_info
         self._attr_device_class = SwitchDeviceClass.SWITCH
 
-    @property
-    def name(self) -> str:
-        """Return the display name of this switch."""
-        return self._name
-
     @property
     def is_on(self):
         """Return true if the mode equals standby."""
@@ -41,47 +37,26 @@ class WavinSentioStandbySwitchEntity(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn on the standby mode."""
-        self._dataservice.turn_on_standby()
+        await self._dataservice.turn_on_standby()
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
         """Turn off the standby mode."""
-        self._dataservice.turn_off_standby()
+        await self._dataservice.turn_off_standby()
         await self.coordinator.async_request_refresh()
 
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return str(self._dataservice.get_device().name ) + "-Standby"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        return DeviceInfo(
-            identifiers= {
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._dataservice.get_device().name)
-            },
-            name = self._dataservice.get_device().lastConfig.sentio.titlePersonalized,
-            manufacturer = "Wavin",
-            model = "Sentio",
-        )
-
 class WavinSentioVacationSwitchEntity(CoordinatorEntity, SwitchEntity):
     """Switch entity for controlling the vacation mode of a Wavin Sentio device."""
 
     def __init__(self, dataservice: WavinSentioDataCoordinator) -> None:
         """Initialize the Wavin Sentio Vacation Switch entity."""
-        super().__init__(dataservice)
+        super().__init__(dataservice, context=DEVICE_CONTEXT)
         self._dataservice = dataservice
-        self._name = "Vacation"
+        self._attr_name = "Vacation"
+        self._attr_unique_id = str(dataservice.get_device().name) + "-Vacation"
+        self._attr_device_info = dataservice.device_info
         self._attr_device_class = SwitchDeviceClass.SWITCH
 
-    @property
-    def name(self) -> str:
-        """Return the display name of this switch."""
-        return self._name
-
     @property
     def is_on(self):
         """Return true if the mode equals Vacation."""
@@ -89,30 +64,10 @@ class WavinSentioVacationSwitchEntity(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn on the vacation mode."""
-        self._dataservice.turn_on_vacation_mode_device()
+        await self._dataservice.turn_on_vacation_mode_device()
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
         """Turn off the standby mode."""
-        self._dataservice.turn_off_vacation_mode_device()
+        await self._dataservice.turn_off_vacation_mode_device()
         await self.coordinator.async_request_refresh()
-
-    @property
-    def unique_id(self):
-        """Return the ID of this device."""
-        return str(self._dataservice.get_device().name ) + "-Vacation"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity."""
-        return DeviceInfo(
-            identifiers= {
-                # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._dataservice.get_device().name)
-            },
-            name = self._dataservice.get_device().lastConfig.sentio.titlePersonalized,
-            manufacturer = "Wavin",
-            model = "Sentio",
-            serial_number = self._dataservice.get_device().serialNumber,
-            sw_version = self._dataservice.get_device().firmwareInstalled,
-        )
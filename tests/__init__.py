@@ -0,0 +1 @@
+"""Tests for the Wavin Sentio integration."""
@@ -0,0 +1,143 @@
+"""In-memory stand-in for the Wavin Sentio cloud client."""
+
+from collections import Counter
+import copy
+import threading
+
+from wavinsentio.wavinsentio import Device
+
+DEVICE_NAME = "devices/soak"
+
+
+def _room(room_id: int) -> dict:
+    return {
+        "id": room_id,
+        "titlePersonalized": f"Room {room_id}",
+        "airTemperature": 21.0,
+        "floorTemperature": 24.0,
+        "humidity": 45,
+        "setpointTemperature": 21,
+        "minSetpointTemperature": 6,
+        "maxSetpointTemperature": 30,
+        "vacationMode": "VACATION_MODE_OFF",
+        "lockMode": "LOCK_MODE_UNLOCKED",
+        "temperatureState": "TEMPERATURE_STATE_IDLE",
+        "temperaturePresets": [
+            {"type": "TYPE_ECO", "hcMode": "HC_MODE_HEATING", "setpointTemperature": 19},
+            {"type": "TYPE_COMFORT", "hcMode": "HC_MODE_HEATING", "setpointTemperature": 21},
+            {"type": "TYPE_EXTRA_COMFORT", "hcMode": "HC_MODE_HEATING", "setpointTemperature": 23},
+        ],
+    }
+
+
+def device_data(rooms: int = 8, outdoor_sensors: int = 1) -> dict:
+    """Return the GetDevice body of a controller."""
+    return {
+        "name": DEVICE_NAME,
+        "serialNumber": "0001",
+        "firmwareInstalled": "18.0",
+        "lastConfig": {
+            "sentio": {
+                "titlePersonalized": "Soak",
+                "standbyMode": "STANDBY_MODE_OFF",
+                "vacationSettings": {
+                    "vacationMode": "VACATION_MODE_OFF",
+                    "vacationModeUntil": "2030-01-01T00:00:00+00:00",
+                },
+                "hcMode": "HC_MODE_HEATING",
+                "availableHcModes": ["HC_MODE_HEATING", "HC_MODE_COOLING"],
+                "rooms": [_room(room_id) for room_id in range(1, rooms + 1)],
+                "outdoorTemperatureSensors": [
+                    {"id": sensor_id, "outdoorTemperature": 5.0}
+                    for sensor_id in range(1, outdoor_sensors + 1)
+                ],
+            }
+        },
+    }
+
+
+class FakeWavinSentio:
+    """Serve one controller from memory through the WavinSentio client interface.
+
+    Every poll returns freshly parsed Device objects, like the real client, and
+    the temperatures drift so that entity states change. Setting failing makes
+    get_device raise like the library does on a malformed response. The names
+    in extra_devices are listed by get_devices as further controllers.
+    """
+
+    extra_devices: tuple[str, ...] = ()
+
+    def __init__(self, email, password, rooms: int = 8, outdoor_sensors: int = 1) -> None:
+        """Initialize the fake cloud."""
+        self.email = email
+        self.password = password
+        self.failing = False
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        self._tick = 0
+        self._data = device_data(rooms, outdoor_sensors)
+
+    @property
+    def _sentio(self) -> dict:
+        return self._data["lastConfig"]["sentio"]
+
+    def _room(self, room_id) -> dict:
+        return next(room for room in self._sentio["rooms"] if room["id"] == room_id)
+
+    def get_devices(self) -> list[Device]:
+        """Return the controller and any extra controllers."""
+        with self._lock:
+            self.calls["get_devices"] += 1
+            devices = [Device(copy.deepcopy(self._data))]
+            for name in self.extra_devices:
+                data = copy.deepcopy(self._data)
+                data["name"] = name
+                data["lastConfig"]["sentio"]["titlePersonalized"] = name
+                devices.append(Device(data))
+            return devices
+
+    def get_device(self, device_name) -> Device:
+        """Return a fresh snapshot of the controller."""
+        with self._lock:
+            self.calls["get_device"] += 1
+            if self.failing:
+                raise KeyError("devices")
+            self._tick += 1
+            drift = (self._tick % 20) / 10
+            for room in self._sentio["rooms"]:
+                room["airTemperature"] = 20.0 + drift
+            for sensor in self._sentio["outdoorTemperatureSensors"]:
+                sensor["outdoorTemperature"] = drift
+            return Device(copy.deepcopy(self._data))
+
+    def set_temperature(self, device_name, room_id, temperature):
+        """Set the setpoint of a room."""
+        with self._lock:
+            self.calls["set_temperature"] += 1
+            self._room(room_id)["setpointTemperature"] = temperature
+
+    def set_standby_mode(self, device_name, standby_mode):
+        """Set the standby mode of the controller."""
+        with self._lock:
+            self.calls["set_standby_mode"] += 1
+            self._sentio["standbyMode"] = standby_mode.value
+
+    def set_vacation_mode(self, device_name, vacation_mode):
+        """Set the vacation mode of the controller."""
+        with self._lock:
+            self.calls["set_vacation_mode"] += 1
+            self._sentio["vacationSettings"]["vacationMode"] = vacation_mode.value
+
+    def set_vacation_mode_room(self, device_name, room_id, vacation_mode):
+        """Set the vacation mode of a room."""
+        with self._lock:
+            self.calls["set_vacation_mode_room"] += 1
+            self._room(room_id)["vacationMode"] = vacation_mode.value
+
+    def set_vacation_mode_until(self, device_name, vacation_mode_until):
+        """Set the end of the vacation."""
+        with self._lock:
+            self.calls["set_vacation_mode_until"] += 1
+            self._sentio["vacationSettings"]["vacationModeUntil"] = (
+                vacation_mode_until.isoformat()
+            )
@@ -0,0 +1,83 @@
+"""Tests for recording and replaying Wavin Sentio cloud traffic."""
+
+import json
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+import requests
+from wavinsentio import wavinsentio
+from wavinsentio.wavinsentio import StandbyMode, WavinSentio
+
+from custom_components.wavinsentio import WavinSentioDataCoordinator
+from custom_components.wavinsentio.capture import TrafficRecorder, WavinSentioReplay
+
+from .fake_cloud import DEVICE_NAME, device_data
+
+EMAIL = "capture@example.com"
+PASSWORD = "hunter2-password"
+ID_TOKEN = "id-token-secret"
+REFRESH_TOKEN = "refresh-token-secret"
+REGISTRATION_KEY = "registration-key-secret"
+API_KEY = WavinSentio.AUTHOURIZE_URL.rsplit("key=", 1)[-1]
+
+
+def _response(body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def _fake_post(url, **kwargs) -> requests.Response:
+    """Answer the posts of the library like the cloud would."""
+    if url == WavinSentio.AUTHOURIZE_URL:
+        return _response(
+            {"email": EMAIL, "idToken": ID_TOKEN, "refreshToken": REFRESH_TOKEN}
+        )
+    if url.endswith("/GetDevice"):
+        return _response({**device_data(), "registrationKey": REGISTRATION_KEY})
+    return _response({})
+
+
+def _record(recorder: TrafficRecorder) -> None:
+    """Log in, poll once and send a command through the recorder."""
+    api = recorder.call(WavinSentio, EMAIL, PASSWORD)
+    recorder.call(api.get_device, DEVICE_NAME)
+    recorder.call(api.set_standby_mode, DEVICE_NAME, StandbyMode.STANDBY_MODE_ON)
+
+
+async def test_capture_is_redacted_and_replays(hass: HomeAssistant, tmp_path) -> None:
+    """A capture holds no secrets and can drive the coordinator."""
+    path = tmp_path / "capture.jsonl"
+    original_requests = wavinsentio.requests
+    recorder = TrafficRecorder(str(path))
+    assert wavinsentio.requests is not original_requests
+    with patch("requests.post", _fake_post):
+        await hass.async_add_executor_job(_record, recorder)
+    recorder.close()
+    assert wavinsentio.requests is original_requests
+
+    capture = path.read_text(encoding="utf-8")
+    endpoints = [json.loads(line).get("endpoint") for line in capture.splitlines()]
+    assert endpoints == ["accounts:signInWithPassword", "GetDevice", "SendDeviceConfig"]
+    for secret in (EMAIL, PASSWORD, ID_TOKEN, REFRESH_TOKEN, REGISTRATION_KEY, API_KEY):
+        assert secret not in capture
+
+    replay = WavinSentioReplay(str(path), speed=0)
+    coordinator = WavinSentioDataCoordinator(hass, replay, DEVICE_NAME)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.get_device().name == DEVICE_NAME
+    await coordinator.turn_on_standby()
+
+
+async def test_requests_restored_after_last_recorder(tmp_path) -> None:
+    """The requests module is put back once every recorder is closed."""
+    original_requests = wavinsentio.requests
+    first = TrafficRecorder(str(tmp_path / "first.jsonl"))
+    second = TrafficRecorder(str(tmp_path / "second.jsonl"))
+    first.close()
+    first.close()
+    assert wavinsentio.requests is not original_requests
+    second.close()
+    assert wavinsentio.requests is original_requests
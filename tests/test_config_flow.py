@@ -0,0 +1,124 @@
+"""Tests for the Wavin Sentio config flow."""
+
+from unittest.mock import patch
+
+from homeassistant import config_entries
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.wavinsentio.const import CONF_DEVICE_NAME, DOMAIN
+
+from .fake_cloud import DEVICE_NAME, FakeWavinSentio
+
+SECOND_DEVICE_NAME = "devices/second"
+
+
+class CountingWavinSentio(FakeWavinSentio):
+    """Fake cloud client that counts logins."""
+
+    extra_devices = (SECOND_DEVICE_NAME,)
+    logins = 0
+
+    def __init__(self, email, password) -> None:
+        """Log in."""
+        type(self).logins += 1
+        super().__init__(email, password)
+
+
+async def _add_controller(hass: HomeAssistant, device_name: str, password: str = "secret"):
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] is FlowResultType.FORM
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_EMAIL: "user@example.com", CONF_PASSWORD: password}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "device"
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_DEVICE_NAME: device_name}
+    )
+
+
+async def test_one_login_per_account(hass: HomeAssistant) -> None:
+    """Onboarding two controllers of one account logs in once."""
+    CountingWavinSentio.logins = 0
+    with patch("custom_components.wavinsentio.WavinSentio", CountingWavinSentio):
+        result = await _add_controller(hass, DEVICE_NAME)
+        assert result["type"] is FlowResultType.CREATE_ENTRY
+        await hass.async_block_till_done()
+        assert CountingWavinSentio.logins == 1
+
+        result = await _add_controller(hass, SECOND_DEVICE_NAME)
+        assert result["type"] is FlowResultType.CREATE_ENTRY
+        await hass.async_block_till_done()
+        assert CountingWavinSentio.logins == 1
+
+        entries = hass.config_entries.async_entries(DOMAIN)
+        assert [entry.state for entry in entries] == [ConfigEntryState.LOADED] * 2
+
+        # Both controllers are configured, so a third flow has nothing to offer.
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_EMAIL: "user@example.com", CONF_PASSWORD: "secret"}
+        )
+        assert result["type"] is FlowResultType.ABORT
+        assert result["reason"] == "already_configured"
+        assert CountingWavinSentio.logins == 1
+
+    for entry in entries:
+        assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not hass.data[DOMAIN]["sessions"]
+
+
+async def test_reauth_reuses_flow_login(hass: HomeAssistant) -> None:
+    """The reload after a reauth uses the login made by the reauth flow."""
+    CountingWavinSentio.logins = 0
+    with patch("custom_components.wavinsentio.WavinSentio", CountingWavinSentio):
+        result = await _add_controller(hass, DEVICE_NAME)
+        assert result["type"] is FlowResultType.CREATE_ENTRY
+        await hass.async_block_till_done()
+        assert CountingWavinSentio.logins == 1
+
+        entry = hass.config_entries.async_entries(DOMAIN)[0]
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={
+                "source": config_entries.SOURCE_REAUTH,
+                "entry_id": entry.entry_id,
+                "unique_id": entry.unique_id,
+            },
+            data=entry.data,
+        )
+        assert result["type"] is FlowResultType.FORM
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_EMAIL: "user@example.com", CONF_PASSWORD: "changed"}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_DEVICE_NAME: DEVICE_NAME}
+        )
+        assert result["type"] is FlowResultType.ABORT
+        assert result["reason"] == "reauth_successful"
+        await hass.async_block_till_done()
+        assert entry.data[CONF_PASSWORD] == "changed"
+        assert entry.state is ConfigEntryState.LOADED
+        assert CountingWavinSentio.logins == 2
+
+
+async def test_abandoned_flow_drops_session(hass: HomeAssistant) -> None:
+    """A flow that ends without an entry does not keep the login."""
+    with patch("custom_components.wavinsentio.WavinSentio", CountingWavinSentio):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_EMAIL: "user@example.com", CONF_PASSWORD: "secret"}
+        )
+        assert hass.data[DOMAIN]["sessions"]
+        hass.config_entries.flow.async_abort(result["flow_id"])
+    assert not hass.data[DOMAIN]["sessions"]
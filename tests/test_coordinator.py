@@ -0,0 +1,73 @@
+"""Tests for the polling interval of the Wavin Sentio coordinator."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.wavinsentio.const import (
+    CONF_DEVICE_NAME,
+    DEFAULT_BACKGROUND_SCAN_INTERVAL,
+    DEVICE_CONTEXT,
+    DOMAIN,
+)
+
+from .fake_cloud import DEVICE_NAME, FakeWavinSentio
+
+FOREGROUND_ENTITIES = [
+    *(("climate", room_id) for room_id in range(1, 9)),
+    ("switch", f"{DEVICE_NAME}-Standby"),
+    ("switch", f"{DEVICE_NAME}-Vacation"),
+    ("datetime", f"{DEVICE_NAME}_vacation_mode_until"),
+]
+
+
+async def test_background_only_polls_slowly(hass: HomeAssistant) -> None:
+    """Polling slows down without foreground entities and speeds up again with one."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_EMAIL: "user@example.com",
+            CONF_PASSWORD: "secret",
+            CONF_DEVICE_NAME: DEVICE_NAME,
+        },
+        unique_id=DEVICE_NAME,
+    )
+    entry.add_to_hass(hass)
+    entity_registry = er.async_get(hass)
+    for domain, unique_id in FOREGROUND_ENTITIES:
+        entity_registry.async_get_or_create(
+            domain,
+            DOMAIN,
+            unique_id,
+            config_entry=entry,
+            disabled_by=er.RegistryEntryDisabler.USER,
+        )
+
+    with patch("custom_components.wavinsentio.WavinSentio", FakeWavinSentio):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN]["coordinator" + DEVICE_NAME]
+    cloud: FakeWavinSentio = coordinator.api
+    assert not hass.states.async_entity_ids("climate")
+    assert hass.states.async_entity_ids("sensor")
+    assert coordinator.update_interval == timedelta(
+        minutes=DEFAULT_BACKGROUND_SCAN_INTERVAL
+    )
+
+    polls_before = cloud.calls["get_device"]
+    remove_listener = coordinator.async_add_listener(lambda: None, DEVICE_CONTEXT)
+    await hass.async_block_till_done()
+    assert coordinator.update_interval == timedelta(seconds=120)
+    assert cloud.calls["get_device"] > polls_before
+
+    remove_listener()
+    assert coordinator.update_interval == timedelta(
+        minutes=DEFAULT_BACKGROUND_SCAN_INTERVAL
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,165 @@
+"""Soak test driving the integration against a fake cloud on an accelerated clock.
+
+Every step advances Home Assistant's clock by one poll interval, so a
+simulated week takes minutes. Commands are sent through the entity services
+and the fake cloud fails in bursts. The test asserts that memory stays
+bounded, that no tasks are left behind and that the p99 refresh latency does
+not creep up. Set SOAK_DAYS to soak longer than the default single day.
+"""
+
+from array import array
+import asyncio
+from datetime import timedelta
+import gc
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from homeassistant.components.climate import ATTR_PRESET_MODE, SERVICE_SET_PRESET_MODE
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.wavinsentio.const import CONF_DEVICE_NAME, DOMAIN
+
+from .fake_cloud import DEVICE_NAME, FakeWavinSentio
+
+SOAK_DAYS = float(os.environ.get("SOAK_DAYS", "1"))
+POLL_INTERVAL = timedelta(seconds=120)
+POLLS = int(SOAK_DAYS * 86400 / POLL_INTERVAL.total_seconds())
+WARMUP_POLLS = min(100, POLLS // 10)
+
+COMMAND_EVERY = 15
+BURST_EVERY = 200
+BURST_LENGTH = 5
+
+MAX_MEMORY_GROWTH = 512 * 1024
+LATENCY_TOLERANCE = 1.5
+LATENCY_SLACK = 0.005
+
+
+def _p99(samples) -> float:
+    return statistics.quantiles(samples, n=100)[98]
+
+
+def _pending_tasks() -> list[asyncio.Task]:
+    current = asyncio.current_task()
+    return [task for task in asyncio.all_tasks() if task is not current and not task.done()]
+
+
+async def _send_commands(hass: HomeAssistant, step: int, climates: list[str]) -> None:
+    """Exercise every writable platform once."""
+    climate = climates[step % len(climates)]
+    await hass.services.async_call(
+        "climate",
+        "set_temperature",
+        {ATTR_ENTITY_ID: climate, ATTR_TEMPERATURE: 18 + step % 5},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        "climate",
+        SERVICE_SET_PRESET_MODE,
+        {ATTR_ENTITY_ID: climate, ATTR_PRESET_MODE: "Comfort"},
+        blocking=True,
+    )
+    for service in ("turn_on", "turn_off"):
+        await hass.services.async_call(
+            "switch", service, {ATTR_ENTITY_ID: "switch.standby"}, blocking=True
+        )
+    await hass.services.async_call(
+        "datetime",
+        "set_value",
+        {
+            ATTR_ENTITY_ID: "datetime.vacation_mode_until",
+            "datetime": dt_util.utcnow() + timedelta(days=step % 30 + 1),
+        },
+        blocking=True,
+    )
+
+
+@pytest.mark.timeout(0)
+async def test_soak(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    """Poll for simulated days with commands and error bursts in between."""
+    # pytest keeps every captured record, which would show up as memory growth.
+    caplog.set_level(logging.CRITICAL)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_EMAIL: "soak@example.com",
+            CONF_PASSWORD: "secret",
+            CONF_DEVICE_NAME: DEVICE_NAME,
+        },
+        unique_id=DEVICE_NAME,
+    )
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.wavinsentio.WavinSentio", FakeWavinSentio):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN]["coordinator" + DEVICE_NAME]
+    cloud: FakeWavinSentio = coordinator.api
+    assert set(coordinator.platforms) == {"climate", "sensor", "switch", "datetime"}
+    climates = hass.states.async_entity_ids("climate")
+    assert len(climates) == 8
+    assert coordinator.update_interval == POLL_INTERVAL
+
+    now = dt_util.utcnow()
+    # Preallocated so that collecting samples does not allocate during the soak.
+    latencies = array("d", bytes(8 * (POLLS - WARMUP_POLLS)))
+    baseline = 0
+    tracemalloc.start()
+    try:
+        for step in range(POLLS):
+            if step == WARMUP_POLLS:
+                gc.collect()
+                baseline = tracemalloc.get_traced_memory()[0]
+
+            cloud.failing = step % BURST_EVERY >= BURST_EVERY - BURST_LENGTH
+            polls_before = cloud.calls["get_device"]
+            now += POLL_INTERVAL
+            start = time.perf_counter()
+            async_fire_time_changed(hass, now)
+            await hass.async_block_till_done()
+            if step >= WARMUP_POLLS:
+                latencies[step - WARMUP_POLLS] = time.perf_counter() - start
+            assert cloud.calls["get_device"] > polls_before
+            assert coordinator.last_update_success is not cloud.failing
+
+            if not cloud.failing and step % COMMAND_EVERY == 0:
+                await _send_commands(hass, step, climates)
+                await hass.async_block_till_done()
+                assert not _pending_tasks()
+
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert growth < MAX_MEMORY_GROWTH, f"memory grew by {growth} bytes"
+
+    third = len(latencies) // 3
+    early, late = _p99(latencies[:third]), _p99(latencies[-third:])
+    assert late <= early * LATENCY_TOLERANCE + LATENCY_SLACK, (
+        f"p99 refresh latency went from {early:.4f}s to {late:.4f}s"
+    )
+
+    assert not _pending_tasks()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.NOT_LOADED
+    assert "coordinator" + DEVICE_NAME not in hass.data[DOMAIN]
+    assert not coordinator._listeners
+    assert not _pending_tasks()
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    assert not hass.data[DOMAIN]["sessions"]